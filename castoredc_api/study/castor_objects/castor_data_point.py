@@ -1,5 +1,7 @@
 """Module for representing a Castor datapoint in Python."""
+import re
 from datetime import datetime
+from functools import lru_cache
 import typing
 import numpy as np
 import pandas as pd
@@ -9,19 +11,94 @@ if typing.TYPE_CHECKING:
     from castoredc_api.study.castor_objects.castor_field import CastorField
     from castoredc_api.study.castor_study import CastorStudy
 
+# User missings as exported by Castor, mapped to their numeric code
+_MISSING_RE = re.compile(
+    r"(measurement failed|not applicable|not asked|asked but unknown|not done)"
+)
+_MISSING_NUMERIC = {
+    "measurement failed": -95,
+    "not applicable": -96,
+    "not asked": -97,
+    "asked but unknown": -98,
+    "not done": -99,
+}
+_MISSING_TIME = {reason: str(code) for reason, code in _MISSING_NUMERIC.items()}
+_MISSING_OPTION = {reason: reason for reason in _MISSING_NUMERIC}
+# Dates and datetimes encode user missings as 1st of January of the year 2995-2999
+_MISSING_YEAR = {reason: 2900 - code for reason, code in _MISSING_NUMERIC.items()}
+
+
+@lru_cache(maxsize=None)
+def _missing_dates(freq: str, date_format: str) -> typing.Dict[str, str]:
+    """Returns the formatted date for each user missing, computed once per format."""
+    return {
+        reason: pd.Period(year=year, month=1, day=1, freq=freq).strftime(date_format)
+        for reason, year in _MISSING_YEAR.items()
+    }
+
+
+# Visit dates and times repeat a lot across records, so cache the parsed values
+@lru_cache(maxsize=4096)
+def _parse_date(raw_value: str) -> datetime:
+    """Parses a date as exported by Castor."""
+    return datetime.strptime(raw_value, "%d-%m-%Y")
+
+
+@lru_cache(maxsize=4096)
+def _parse_datetime(raw_value: str) -> datetime:
+    """Parses a datetime as exported by Castor."""
+    return datetime.strptime(raw_value, "%d-%m-%Y;%H:%M")
+
+
+@lru_cache(maxsize=4096)
+def _parse_time(raw_value: str) -> datetime:
+    """Parses a time as exported by Castor."""
+    return datetime.strptime(raw_value, "%H:%M")
+
+
+# All data points of a form instance share the moment they were filled in
+@lru_cache(maxsize=8192)
+def _parse_filled_in(filled_in: str) -> datetime:
+    """Parses the moment a data point was filled in as exported by Castor."""
+    return datetime.strptime(filled_in, "%Y-%m-%d %H:%M:%S")
+
+
+def _detect_missing(raw_value: str) -> typing.Optional[str]:
+    """Returns the reason of a user missing or None if it is not recognized."""
+    # Castor exports user missings as "Missing (reason)"
+    _, _, reason = raw_value.partition("(")
+    reason = reason.rstrip(")")
+    if reason in _MISSING_NUMERIC:
+        return reason
+    match = _MISSING_RE.search(raw_value)
+    return None if match is None else match.group(1)
+
 
 class CastorDataPoint:
     """Object representing a Castor datapoint.
     Is an instance of a field with a value for a record.."""
 
+    # Studies contain many data points, so don't give each one a __dict__
+    __slots__ = (
+        "field_id",
+        "raw_value",
+        "instance_of",
+        "form_instance",
+        "filled_in",
+        "value",
+    )
+
     def __init__(
         self,
         field_id: str,
         raw_value: typing.Union[str, int],
         study: "CastorStudy",
         filled_in: str,
+        defer_bulk: bool = False,
     ) -> None:
-        """Creates a CastorField."""
+        """Creates a CastorField.
+        Set defer_bulk to leave dates and datetimes to CastorStudy.interpret_bulk.
+        """
         self.field_id = field_id
         self.raw_value = raw_value
         self.instance_of = self.find_field(study)
@@ -30,308 +107,21 @@ class CastorDataPoint:
                 "The field that this is an instance of does not exist in the study!"
             )
         self.form_instance = None
-        self.filled_in = (
-            None
-            if filled_in == ""
-            else datetime.strptime(filled_in, "%Y-%m-%d %H:%M:%S")
-        )
+        self.filled_in = None if filled_in == "" else _parse_filled_in(filled_in)
         # Is missing
-        self.value = self.__interpret(study)
+        if defer_bulk and self.instance_of.field_type in BULK_FIELD_TYPES:
+            self.value = None
+        else:
+            self.value = interpret_value(self.instance_of, self.raw_value, study)
 
     # Helpers
     def find_field(self, study: "CastorStudy") -> "CastorField":
         """Returns a single field in the study on id."""
         return study.get_single_field(self.field_id)
 
-    def __interpret(self, study: "CastorStudy"):
-        """Transform the raw value into analysable data."""
-        if self.instance_of.field_type in ["checkbox", "dropdown", "radio"]:
-            interpreted_value = self.__interpret_optiongroup(study)
-        elif self.instance_of.field_type in [
-            "numeric",
-            "slider",
-            "randomization",
-        ]:
-            interpreted_value = self.__interpret_numeric()
-        elif self.instance_of.field_type in ["year"]:
-            interpreted_value = self.__interpret_year()
-        elif self.instance_of.field_type in [
-            "string",
-            "textarea",
-            "upload",
-            "calculation",
-        ]:
-            interpreted_value = self.raw_value
-        elif self.instance_of.field_type in ["datetime"]:
-            interpreted_value = self.__interpret_datetime(
-                study.configuration["datetime"]
-            )
-        elif self.instance_of.field_type in ["date"]:
-            interpreted_value = self.__interpret_date(study.configuration["date"])
-        elif self.instance_of.field_type in ["time"]:
-            interpreted_value = self.__interpret_time(study.configuration["time"])
-        elif self.instance_of.field_type in ["numberdate"]:
-            interpreted_value = self.__interpret_numberdate(study.configuration["date"])
-        else:
-            interpreted_value = "Error"
-        return interpreted_value
-
-    def __interpret_time(self, time_format: str):
-        """Interprets time missing data while handling user missings."""
-        if self.raw_value == "":
-            new_value = ""
-        elif "Missing" in self.raw_value:
-            if "measurement failed" in self.raw_value:
-                new_value = "-95"
-            elif "not applicable" in self.raw_value:
-                new_value = "-96"
-            elif "not asked" in self.raw_value:
-                new_value = "-97"
-            elif "asked but unknown" in self.raw_value:
-                new_value = "-98"
-            elif "not done" in self.raw_value:
-                new_value = "-99"
-            else:
-                new_value = "Missing value not recognized"
-        else:
-            new_value = (
-                datetime.strptime(self.raw_value, "%H:%M").time().strftime(time_format)
-            )
-        return new_value
-
-    def __interpret_datetime(self, datetime_format: str):
-        """Interprets date and datetime data while handling user missings."""
-        if self.raw_value == "":
-            new_value = np.nan
-        elif "Missing" in self.raw_value:
-            if "measurement failed" in self.raw_value:
-                new_value = pd.Period(year=2995, month=1, day=1, freq="S").strftime(
-                    datetime_format
-                )
-            elif "not applicable" in self.raw_value:
-                new_value = pd.Period(year=2996, month=1, day=1, freq="S").strftime(
-                    datetime_format
-                )
-            elif "not asked" in self.raw_value:
-                new_value = pd.Period(year=2997, month=1, day=1, freq="S").strftime(
-                    datetime_format
-                )
-            elif "asked but unknown" in self.raw_value:
-                new_value = pd.Period(year=2998, month=1, day=1, freq="S").strftime(
-                    datetime_format
-                )
-            elif "not done" in self.raw_value:
-                new_value = pd.Period(year=2999, month=1, day=1, freq="S").strftime(
-                    datetime_format
-                )
-            else:
-                new_value = "Missing value not recognized"
-        else:
-            try:
-                new_value = pd.Period(
-                    datetime.strptime(self.raw_value, "%d-%m-%Y;%H:%M"), freq="S"
-                ).strftime(datetime_format)
-            except ValueError:
-                new_value = pd.Period(
-                    datetime.strptime(self.raw_value, "%d-%m-%Y"), freq="S"
-                ).strftime(datetime_format)
-
-        return new_value
-
-    def __interpret_date(self, date_format: str):
-        """Interprets date and datetime data while handling user missings."""
-        if self.raw_value == "":
-            new_value = np.nan
-        elif "Missing" in self.raw_value:
-            if "measurement failed" in self.raw_value:
-                new_value = pd.Period(year=2995, month=1, day=1, freq="D").strftime(
-                    date_format
-                )
-            elif "not applicable" in self.raw_value:
-                new_value = pd.Period(year=2996, month=1, day=1, freq="D").strftime(
-                    date_format
-                )
-            elif "not asked" in self.raw_value:
-                new_value = pd.Period(year=2997, month=1, day=1, freq="D").strftime(
-                    date_format
-                )
-            elif "asked but unknown" in self.raw_value:
-                new_value = pd.Period(year=2998, month=1, day=1, freq="D").strftime(
-                    date_format
-                )
-            elif "not done" in self.raw_value:
-                new_value = pd.Period(year=2999, month=1, day=1, freq="D").strftime(
-                    date_format
-                )
-            else:
-                new_value = "Missing value not recognized"
-        else:
-            new_value = pd.Period(
-                datetime.strptime(self.raw_value, "%d-%m-%Y"), freq="D"
-            ).strftime(date_format)
-
-        return new_value
-
-    def __interpret_optiongroup(self, study: "CastorStudy"):
-        """Interprets optiongroup data while handling user missings."""
-        if self.raw_value == "":
-            new_value = ""
-        elif "Missing" in self.raw_value:
-            if "measurement failed" in self.raw_value:
-                new_value = "measurement failed"
-            elif "not applicable" in self.raw_value:
-                new_value = "not applicable"
-            elif "not asked" in self.raw_value:
-                new_value = "not asked"
-            elif "asked but unknown" in self.raw_value:
-                new_value = "asked but unknown"
-            elif "not done" in self.raw_value:
-                new_value = "not done"
-            else:
-                new_value = "Missing value not recognized"
-        else:
-            new_value = self.__interpret_optiongroup_helper(study)
-        return new_value
-
-    def __interpret_optiongroup_helper(self, study):
-        """Interprets values in an optiongroup field."""
-        # Get the optiongroup for this data point
-        optiongroup = self.instance_of.field_option_group
-        # Retrieve the options
-        study_optiongroup = study.get_single_optiongroup(optiongroup)
-        if study_optiongroup is None:
-            raise CastorException(
-                "Optiongroup not found. Is id correct and are optiongroups loaded?"
-            )
-        # Get options
-        options = study_optiongroup["options"]
-        # Transform options into dict value: name
-        link = {item["value"]: item["name"] for item in options}
-        # Get values, split by ; for checklists
-        value_list = self.raw_value.split(";")
-        # Values to names
-        if value_list == [""]:
-            new_values = [""]
-        elif study.pass_keyerrors:
-            new_values = [link.get(value, value) for value in value_list]
-        else:
-            try:
-                new_values = [link[value] for value in value_list]
-            except KeyError as error:
-                raise CastorException(
-                    f"Optional value mapping failed for optiongroup: {study_optiongroup}"
-                    f"Key `{self.raw_value}` not present in the keys of the optiongroup"
-                    f"of field: {self.field_id} ({self.instance_of.field_name})"
-                ) from error
-        # Return a string, for multiple answers separate them with |
-        new_value = "|".join(new_values)
-        return new_value
-
-    def __interpret_numeric(self):
-        """Interprets numeric data while handling user missings."""
-        if self.raw_value == "":
-            new_value = np.nan
-        elif "Missing" in self.raw_value:
-            if "measurement failed" in self.raw_value:
-                new_value = -95
-            elif "not applicable" in self.raw_value:
-                new_value = -96
-            elif "not asked" in self.raw_value:
-                new_value = -97
-            elif "asked but unknown" in self.raw_value:
-                new_value = -98
-            elif "not done" in self.raw_value:
-                new_value = -99
-            else:
-                new_value = "Missing value not recognized"
-        else:
-            new_value = float(self.raw_value)
-        return new_value
-
-    def __interpret_year(self):
-        """Interprets year data while handling user missings."""
-        if self.raw_value == "":
-            new_value = np.nan
-        elif "Missing" in self.raw_value:
-            if "measurement failed" in self.raw_value:
-                new_value = -95
-            elif "not applicable" in self.raw_value:
-                new_value = -96
-            elif "not asked" in self.raw_value:
-                new_value = -97
-            elif "asked but unknown" in self.raw_value:
-                new_value = -98
-            elif "not done" in self.raw_value:
-                new_value = -99
-            else:
-                new_value = "Missing value not recognized"
-        else:
-            new_value = int(self.raw_value)
-        return new_value
-
-    def __interpret_numberdate(self, date_format: str):
-        """Interprets numberdate data while handling user missings."""
-        if self.raw_value == "":
-            new_value = [
-                np.nan,
-                np.nan,
-            ]
-        elif "Missing" in self.raw_value:
-            if "measurement failed" in self.raw_value:
-                new_value = [
-                    -95,
-                    pd.Period(year=2995, month=1, day=1, freq="D").strftime(
-                        date_format
-                    ),
-                ]
-            elif "not applicable" in self.raw_value:
-                new_value = [
-                    -96,
-                    pd.Period(year=2996, month=1, day=1, freq="D").strftime(
-                        date_format
-                    ),
-                ]
-            elif "not asked" in self.raw_value:
-                new_value = [
-                    -97,
-                    pd.Period(year=2997, month=1, day=1, freq="D").strftime(
-                        date_format
-                    ),
-                ]
-            elif "asked but unknown" in self.raw_value:
-                new_value = [
-                    -98,
-                    pd.Period(year=2998, month=1, day=1, freq="D").strftime(
-                        date_format
-                    ),
-                ]
-            elif "not done" in self.raw_value:
-                new_value = [
-                    -99,
-                    pd.Period(year=2999, month=1, day=1, freq="D").strftime(
-                        date_format
-                    ),
-                ]
-            else:
-                new_value = [
-                    "Missing value not recognized",
-                    "Missing value not recognized",
-                ]
-        else:
-            # Get number and date from the string
-            number, date = self.raw_value.split(";")
-            # Combine
-            if number == "":
-                number = np.nan
-            if date == "":
-                date = np.nan
-            new_value = [
-                float(number),
-                pd.Period(datetime.strptime(date, "%d-%m-%Y"), freq="D").strftime(
-                    date_format
-                ),
-            ]
-        return new_value
+    def update_value(self, study: "CastorStudy") -> None:
+        """Interprets the raw value and stores it as the value of the data point."""
+        self.value = interpret_value(self.instance_of, self.raw_value, study)
 
     # Standard Operators
     def __eq__(self, other: typing.Any) -> typing.Union[bool, type(NotImplemented)]:
@@ -351,3 +141,301 @@ class CastorDataPoint:
             + " - "
             + self.instance_of.field_name
         )
+
+
+# Interpretation
+def interpret_value(field: "CastorField", raw_value: str, study: "CastorStudy"):
+    """Transform the raw value of a field into analysable data."""
+    interpreter = _INTERPRETERS.get(field.field_type)
+    if interpreter is None:
+        return "Error"
+    return interpreter(field, raw_value, study)
+
+
+def _interpret_time(_field: "CastorField", raw_value: str, study: "CastorStudy"):
+    """Interprets time missing data while handling user missings."""
+    time_format = study.configuration["time"]
+    if raw_value == "":
+        new_value = ""
+    elif raw_value.startswith("Missing"):
+        reason = _detect_missing(raw_value)
+        new_value = (
+            "Missing value not recognized" if reason is None else _MISSING_TIME[reason]
+        )
+    else:
+        new_value = _parse_time(raw_value).time().strftime(time_format)
+    return new_value
+
+
+def _interpret_datetime(_field: "CastorField", raw_value: str, study: "CastorStudy"):
+    """Interprets date and datetime data while handling user missings."""
+    datetime_format = study.configuration["datetime"]
+    if raw_value == "":
+        new_value = np.nan
+    elif raw_value.startswith("Missing"):
+        reason = _detect_missing(raw_value)
+        new_value = (
+            "Missing value not recognized"
+            if reason is None
+            else _missing_dates("S", datetime_format)[reason]
+        )
+    else:
+        try:
+            new_value = pd.Period(_parse_datetime(raw_value), freq="S").strftime(
+                datetime_format
+            )
+        except ValueError:
+            new_value = pd.Period(_parse_date(raw_value), freq="S").strftime(
+                datetime_format
+            )
+
+    return new_value
+
+
+def _interpret_date(_field: "CastorField", raw_value: str, study: "CastorStudy"):
+    """Interprets date and datetime data while handling user missings."""
+    date_format = study.configuration["date"]
+    if raw_value == "":
+        new_value = np.nan
+    elif raw_value.startswith("Missing"):
+        reason = _detect_missing(raw_value)
+        new_value = (
+            "Missing value not recognized"
+            if reason is None
+            else _missing_dates("D", date_format)[reason]
+        )
+    else:
+        new_value = pd.Period(_parse_date(raw_value), freq="D").strftime(date_format)
+
+    return new_value
+
+
+def _interpret_optiongroup(field: "CastorField", raw_value: str, study: "CastorStudy"):
+    """Interprets optiongroup data while handling user missings."""
+    if raw_value == "":
+        new_value = ""
+    elif raw_value.startswith("Missing"):
+        reason = _detect_missing(raw_value)
+        new_value = (
+            "Missing value not recognized"
+            if reason is None
+            else _MISSING_OPTION[reason]
+        )
+    else:
+        new_value = _interpret_optiongroup_helper(field, raw_value, study)
+    return new_value
+
+
+def _interpret_optiongroup_helper(
+    field: "CastorField", raw_value: str, study: "CastorStudy"
+):
+    """Interprets values in an optiongroup field."""
+    # Get the optiongroup for this data point
+    optiongroup = field.field_option_group
+    # Retrieve the options as dict value: name
+    link = study.get_optiongroup_link(optiongroup)
+    if link is None:
+        raise CastorException(
+            "Optiongroup not found. Is id correct and are optiongroups loaded?"
+        )
+    try:
+        if ";" not in raw_value:
+            # Single answer, no need to split and join
+            if study.pass_keyerrors:
+                new_value = link.get(raw_value, raw_value)
+            else:
+                new_value = link[raw_value]
+        else:
+            # Get values, split by ; for checklists
+            # Return a string, for multiple answers separate them with |
+            if study.pass_keyerrors:
+                new_value = "|".join(
+                    link.get(value, value) for value in raw_value.split(";")
+                )
+            else:
+                new_value = "|".join(link[value] for value in raw_value.split(";"))
+    except KeyError as error:
+        raise CastorException(
+            "Optional value mapping failed for optiongroup: "
+            f"{study.get_single_optiongroup(optiongroup)}"
+            f"Key `{raw_value}` not present in the keys of the optiongroup"
+            f"of field: {field.field_id} ({field.field_name})"
+        ) from error
+    return new_value
+
+
+def _interpret_numeric(_field: "CastorField", raw_value: str, _study: "CastorStudy"):
+    """Interprets numeric data while handling user missings."""
+    if raw_value == "":
+        new_value = np.nan
+    elif raw_value.startswith("Missing"):
+        reason = _detect_missing(raw_value)
+        new_value = (
+            "Missing value not recognized"
+            if reason is None
+            else _MISSING_NUMERIC[reason]
+        )
+    else:
+        new_value = float(raw_value)
+    return new_value
+
+
+def _interpret_year(_field: "CastorField", raw_value: str, _study: "CastorStudy"):
+    """Interprets year data while handling user missings."""
+    if raw_value == "":
+        new_value = np.nan
+    elif raw_value.startswith("Missing"):
+        reason = _detect_missing(raw_value)
+        new_value = (
+            "Missing value not recognized"
+            if reason is None
+            else _MISSING_NUMERIC[reason]
+        )
+    else:
+        new_value = int(raw_value)
+    return new_value
+
+
+def _interpret_numberdate(_field: "CastorField", raw_value: str, study: "CastorStudy"):
+    """Interprets numberdate data while handling user missings."""
+    date_format = study.configuration["date"]
+    if raw_value == "":
+        new_value = [
+            np.nan,
+            np.nan,
+        ]
+    elif raw_value.startswith("Missing"):
+        reason = _detect_missing(raw_value)
+        if reason is None:
+            new_value = [
+                "Missing value not recognized",
+                "Missing value not recognized",
+            ]
+        else:
+            new_value = [
+                _MISSING_NUMERIC[reason],
+                _missing_dates("D", date_format)[reason],
+            ]
+    else:
+        # Get number and date from the string
+        number, date = raw_value.split(";")
+        # Combine
+        if number == "":
+            number = np.nan
+        if date == "":
+            date = np.nan
+        new_value = [
+            float(number),
+            pd.Period(_parse_date(date), freq="D").strftime(date_format),
+        ]
+    return new_value
+
+
+def _interpret_string(_field: "CastorField", raw_value: str, _study: "CastorStudy"):
+    """Interprets string data, which is already analysable."""
+    return raw_value
+
+
+# All interpreters share the signature (field, raw_value, study)
+_INTERPRETERS = {
+    "checkbox": _interpret_optiongroup,
+    "dropdown": _interpret_optiongroup,
+    "radio": _interpret_optiongroup,
+    "numeric": _interpret_numeric,
+    "slider": _interpret_numeric,
+    "randomization": _interpret_numeric,
+    "year": _interpret_year,
+    "string": _interpret_string,
+    "textarea": _interpret_string,
+    "upload": _interpret_string,
+    "calculation": _interpret_string,
+    "datetime": _interpret_datetime,
+    "date": _interpret_date,
+    "time": _interpret_time,
+    "numberdate": _interpret_numberdate,
+}
+
+
+# Bulk interpretation
+# Only dates and datetimes are faster to interpret per column than one by one
+BULK_FIELD_TYPES = ("date", "datetime")
+# Below this number of values the overhead of pandas outweighs the gain
+BULK_MIN_VALUES = 100
+
+
+def interpret_column(
+    field: "CastorField", raw_values: pd.Series, study: "CastorStudy"
+) -> pd.Series:
+    """Interprets all raw values of a single field at once.
+    Returns the interpreted values for the raw values that could be handled vectorised,
+    the other raw values (e.g. empty values) are left out and need to be interpreted
+    one by one."""
+    interpreter = _COLUMN_INTERPRETERS.get(field.field_type)
+    if interpreter is None:
+        return raw_values.iloc[:0]
+    return interpreter(field, raw_values, study)
+
+
+def _plain_values(raw_values: pd.Series) -> pd.Series:
+    """Selects the raw values that are neither empty nor a user missing."""
+    plain = (raw_values != "") & ~raw_values.str.startswith("Missing", na=True)
+    return raw_values[plain]
+
+
+def _interpret_missing_column(
+    raw_values: pd.Series, missing_values: typing.Dict[str, typing.Any]
+) -> pd.Series:
+    """Interprets the user missings, unrecognized user missings are left out."""
+    missings = raw_values[raw_values.str.startswith("Missing", na=False)]
+    reasons = missings.str.extract(_MISSING_RE, expand=False)
+    return reasons[reasons.notna()].map(missing_values).astype(object)
+
+
+def _interpret_datetime_column(
+    _field: "CastorField", raw_values: pd.Series, study: "CastorStudy"
+) -> pd.Series:
+    """Interprets datetime data, values that can not be parsed are left out."""
+    datetime_format = study.configuration["datetime"]
+    plain_values = _plain_values(raw_values)
+    datetimes = pd.to_datetime(
+        plain_values, format="%d-%m-%Y;%H:%M", errors="coerce", cache=True
+    )
+    # Datetimes without a time are exported as a date
+    dates = pd.to_datetime(
+        plain_values[datetimes.isna()], format="%d-%m-%Y", errors="coerce", cache=True
+    )
+    datetimes = datetimes.fillna(dates)
+    return pd.concat(
+        [
+            _format_periods(datetimes[datetimes.notna()], "S", datetime_format),
+            _interpret_missing_column(raw_values, _missing_dates("S", datetime_format)),
+        ]
+    )
+
+
+def _interpret_date_column(
+    _field: "CastorField", raw_values: pd.Series, study: "CastorStudy"
+) -> pd.Series:
+    """Interprets date data, values that can not be parsed are left out."""
+    date_format = study.configuration["date"]
+    dates = pd.to_datetime(
+        _plain_values(raw_values), format="%d-%m-%Y", errors="coerce", cache=True
+    )
+    return pd.concat(
+        [
+            _format_periods(dates[dates.notna()], "D", date_format),
+            _interpret_missing_column(raw_values, _missing_dates("D", date_format)),
+        ]
+    )
+
+
+def _format_periods(dates: pd.Series, freq: str, date_format: str) -> pd.Series:
+    """Formats dates the same way as pd.Period.strftime, for all dates at once."""
+    return dates.dt.to_period(freq).dt.strftime(date_format)
+
+
+# All column interpreters share the signature (field, raw_values, study)
+_COLUMN_INTERPRETERS = {
+    "datetime": _interpret_datetime_column,
+    "date": _interpret_date_column,
+}
@@ -12,7 +12,12 @@ import pandas as pd
 from tqdm import tqdm
 
 from castoredc_api import CastorClient, CastorException
-from castoredc_api.study.castor_objects.castor_data_point import CastorDataPoint
+from castoredc_api.study.castor_objects.castor_data_point import (
+    BULK_FIELD_TYPES,
+    BULK_MIN_VALUES,
+    CastorDataPoint,
+    interpret_column,
+)
 from castoredc_api.study.castor_objects import (
     CastorField,
     CastorFormInstance,
@@ -73,9 +78,13 @@ class CastorStudy:
         self.records = {}
         # List of dictionaries of optiongroups
         self.optiongroups = {}
+        # Dictionaries of optiongroup value: name per optiongroup, filled when used
+        self.optiongroup_links = {}
         # Container variables to save time querying the database
         self.all_report_instances = {}
         self.all_survey_packages = {}
+        # Fields that were searched before, to save time searching the structure
+        self.found_fields = {}
 
     # STRUCTURE MAPPING
     def map_structure(self) -> None:
@@ -86,8 +95,10 @@ class CastorStudy:
         self.form_links = {}
         self.records = {}
         self.optiongroups = {}
+        self.optiongroup_links = {}
         self.all_report_instances = {}
         self.all_survey_packages = {}
+        self.found_fields = {}
         # Get the structure from the API
         print("Downloading Study Structure.", flush=True, file=sys.stderr)
         data = self.client.export_study_structure()
@@ -171,6 +182,41 @@ class CastorStudy:
             for instance_id in self.all_report_instances
         }
 
+    def interpret_bulk(
+        self, data_points: Optional[List[CastorDataPoint]] = None
+    ) -> None:
+        """Interprets the raw values of the given data points (default all), one field
+        at a time. Large date and datetime fields are interpreted per column."""
+        if data_points is None:
+            data_points = self.get_all_data_points()
+        data_points_per_field = {}
+        for data_point in data_points:
+            data_points_per_field.setdefault(data_point.field_id, []).append(data_point)
+
+        for data_points_field in tqdm(
+            data_points_per_field.values(), desc="Interpreting Data"
+        ):
+            field = data_points_field[0].instance_of
+            interpreted = {}
+            if (
+                field.field_type in BULK_FIELD_TYPES
+                and len(data_points_field) >= BULK_MIN_VALUES
+            ):
+                raw_values = pd.Series(
+                    [data_point.raw_value for data_point in data_points_field],
+                    dtype=object,
+                )
+                interpreted_values = interpret_column(field, raw_values, self)
+                interpreted = dict(
+                    zip(interpreted_values.index, interpreted_values.tolist())
+                )
+            for position, data_point in enumerate(data_points_field):
+                if position in interpreted:
+                    data_point.value = interpreted[position]
+                else:
+                    # Values that could not be handled in bulk, e.g. empty values
+                    data_point.update_value(self)
+
     # OPTIONGROUPS
     def __load_optiongroups(self) -> None:
         """Loads all optiongroups through the client"""
@@ -180,6 +226,7 @@ class CastorStudy:
         self.optiongroups = {
             optiongroup["id"]: optiongroup for optiongroup in optiongroups
         }
+        self.optiongroup_links = {}
 
     # AUXILIARY DATA
     def __load_record_information(self, archived: bool) -> None:
@@ -402,6 +449,17 @@ class CastorStudy:
         """Get a single optiongroup based on id."""
         return self.optiongroups.get(optiongroup_id)
 
+    def get_optiongroup_link(self, optiongroup_id: str) -> Optional[Dict]:
+        """Get a dict of option value: option name for a single optiongroup based on id."""
+        link = self.optiongroup_links.get(optiongroup_id)
+        if link is None:
+            optiongroup = self.get_single_optiongroup(optiongroup_id)
+            if optiongroup is None:
+                return None
+            link = {item["value"]: item["name"] for item in optiongroup["options"]}
+            self.optiongroup_links[optiongroup_id] = link
+        return link
+
     def add_form(self, form: CastorForm) -> None:
         """Add a CastorForm to the study."""
         self.forms_on_id[form.form_id] = form
@@ -495,12 +553,17 @@ class CastorStudy:
             # Some Castor studies have fields for which the name can be empty
             # These are nonsensical identifiers, so we can't search on these
             return None
+        # Every data point searches for its field, so remember the fields found
+        field = self.found_fields.get(field_id_or_name)
+        if field is not None:
+            return field
         for form in self.get_all_forms():
             for step in form.get_all_steps():
                 # Search for field in each step in each form
                 field = step.get_single_field(field_id_or_name)
                 # If field found (id and name are both unique)
                 if field is not None:
+                    self.found_fields[field_id_or_name] = field
                     return field
         # If field not found
         return None
@@ -586,6 +649,15 @@ class CastorStudy:
         for field in tqdm(data, desc="Mapping Data"):
             self.__handle_row(field)
 
+        # Dates and datetimes were not interpreted yet, interpret them per field
+        self.interpret_bulk(
+            [
+                data_point
+                for data_point in self.get_all_data_points()
+                if data_point.instance_of.field_type in BULK_FIELD_TYPES
+            ]
+        )
+
     def __handle_row(self, field):
         """Handles a row from the export data."""
         # Check if the record for the field exists, if not, create it
@@ -626,11 +698,13 @@ class CastorStudy:
         # Should not happen, but just in case
         data_point = form_instance.get_single_data_point(field["Field ID"])
         if data_point is None:
+            # Dates and datetimes are interpreted per field after linking all data
             data_point = CastorDataPoint(
                 field_id=field["Field ID"],
                 raw_value=field["Value"],
                 study=self,
                 filled_in=field["Date"],
+                defer_bulk=True,
             )
             form_instance.add_data_point(data_point)
         else:
@@ -983,6 +1057,8 @@ class CastorStudy:
         # Get all records
         records = self.get_all_records()
         data = []
+        # Fields are equal on id, look these up instead of comparing to each field
+        field_ids = {field.field_id for field in fields}
 
         for record in records:
             # Test whether data points should be extracted
@@ -991,7 +1067,7 @@ class CastorStudy:
                 filtered_data_points = [
                     data_point
                     for data_point in data_points
-                    if data_point.instance_of in fields
+                    if data_point.instance_of.field_id in field_ids
                 ]
                 record_data = {
                     data_point.instance_of.field_name: data_point.value
@@ -6,9 +6,13 @@ Testing class for the CastorDataPoint class.
 https://orcid.org/0000-0003-3052-596X
 """
 import numpy as np
+import pandas as pd
 import pytest
 
-from castoredc_api.study.castor_objects.castor_data_point import CastorDataPoint
+from castoredc_api.study.castor_objects.castor_data_point import (
+    CastorDataPoint,
+    interpret_column,
+)
 from castoredc_api import CastorException
 
 
@@ -164,3 +168,32 @@ class TestCastorDataPoint:
                     "2021-01-15 13:39:47",
                 )
                 assert data_point.value == formatted
+
+    def test_data_point_interpret_column(self, missing_data_study):
+        """Tests if bulk interpretation gives the same values as one by one"""
+        missings = ["", "Missing (not done)", "Missing (unknown)"]
+        # Raw values and the positions that are interpreted in bulk
+        for field_type, (raw_values, positions) in {
+            "datetime": (["13-05-2021;10:15", "13-05-2021", "32-13-2021"], {0, 1, 4}),
+            "date": (["13-05-2021", "1-5-2021", "32-13-2021"], {0, 1, 4}),
+        }.items():
+            field = missing_data_study.get_single_field(f"MISSING-{field_type}-ID")
+            raw_values = pd.Series(raw_values + missings, dtype=object)
+            interpreted_values = interpret_column(field, raw_values, missing_data_study)
+            assert set(interpreted_values.index) == positions
+            for position, value in interpreted_values.items():
+                data_point = CastorDataPoint(
+                    field.field_id,
+                    raw_values[position],
+                    missing_data_study,
+                    "2021-01-15 13:39:47",
+                )
+                assert value == data_point.value or (
+                    pd.isna(value) and pd.isna(data_point.value)
+                )
+
+    def test_data_point_interpret_column_other(self, missing_data_study):
+        """Tests if field types without column interpreter are left out"""
+        field = missing_data_study.get_single_field("MISSING-numberdate-ID")
+        raw_values = pd.Series(["5;13-05-2021", ""], dtype=object)
+        assert interpret_column(field, raw_values, missing_data_study).empty
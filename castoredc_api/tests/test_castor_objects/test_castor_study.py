@@ -5,9 +5,16 @@ Testing class for the CastorStudy class.
 @author: R.C.A. van Linschoten
 https://orcid.org/0000-0003-3052-596X
 """
+import copy
+
+import pandas as pd
 import pytest
 
 from castoredc_api import CastorException
+from castoredc_api.study.castor_objects.castor_data_point import CastorDataPoint
+from castoredc_api.study.castor_objects.castor_survey_form_instance import (
+    CastorSurveyFormInstance,
+)
 from castoredc_api.study.castor_objects.castor_record import CastorRecord
 from castoredc_api.study.castor_study import CastorStudy
 from castoredc_api.study.castor_objects.castor_form import CastorForm
@@ -194,3 +201,120 @@ class TestCastorStudy:
                 {"Form Type": "Wrong Type"}, "record"
             )
         assert "Form Type: Wrong Type does not exist." in str(e.value)
+
+    def test_study_get_optiongroup_link(self):
+        """Tests getting the value: name link of an optiongroup from a study."""
+        study = CastorStudy("", "", "FAKE-ID", "", test=True)
+        study.optiongroups = {
+            "FAKE-OPTIONGROUP-ID": {
+                "options": [{"value": "1", "name": "Yes"}, {"value": "0", "name": "No"}]
+            }
+        }
+        link = study.get_optiongroup_link("FAKE-OPTIONGROUP-ID")
+        assert link == {"1": "Yes", "0": "No"}
+        assert study.get_optiongroup_link("FAKE-OPTIONGROUP-ID") is link
+        assert study.get_optiongroup_link("FAKE-OPTIONGROUP-ID2") is None
+
+    def test_study_interpret_bulk(self, missing_data_study):
+        """Tests if bulk interpretation gives the same values as one by one."""
+        study = copy.deepcopy(missing_data_study)
+        fallbacks = ["", "Missing (not done)", "Missing (unknown)"]
+        # Large date and datetime fields are interpreted per column, others per value
+        raw_values = {
+            "date": ["13-05-2021", "1-5-2021"] * 60 + fallbacks,
+            "datetime": ["13-05-2021;10:15", "13-05-2021"] * 60 + fallbacks,
+            "numeric": ["12.5", "3"] + fallbacks,
+            "time": ["10:15"] + fallbacks,
+        }
+        data_points = [
+            CastorDataPoint(
+                f"MISSING-{field_type}-ID",
+                raw_value,
+                study,
+                "2021-01-15 13:39:47",
+                defer_bulk=True,
+            )
+            for field_type, values in raw_values.items()
+            for raw_value in values
+        ]
+        # Only dates and datetimes are left uninterpreted
+        assert all(
+            (data_point.value is None)
+            == (data_point.instance_of.field_type in ("date", "datetime"))
+            for data_point in data_points
+        )
+        study.interpret_bulk(data_points)
+        for data_point in data_points:
+            expected = CastorDataPoint(
+                data_point.field_id,
+                data_point.raw_value,
+                study,
+                "2021-01-15 13:39:47",
+            ).value
+            assert data_point.value == expected or (
+                pd.isna(data_point.value) and pd.isna(expected)
+            )
+
+    def test_study_interpret_bulk_fail(self, missing_data_study):
+        """Tests if an unparseable value fails in bulk like it does one by one."""
+        data_points = [
+            CastorDataPoint(
+                "MISSING-date-ID",
+                raw_value,
+                missing_data_study,
+                "2021-01-15 13:39:47",
+                defer_bulk=True,
+            )
+            for raw_value in ["13-05-2021"] * 100 + ["32-13-2021"]
+        ]
+        with pytest.raises(ValueError):
+            missing_data_study.interpret_bulk(data_points)
+
+    def test_handle_data_point_defers_dates(self, missing_data_study):
+        """Tests if only dates and datetimes are left to bulk interpretation."""
+        study = copy.deepcopy(missing_data_study)
+        form_instance = CastorSurveyFormInstance(
+            "FAKE-SURVEY-INSTANCE-ID", "Fake Survey", study
+        )
+        for field_type, raw_value in {
+            "date": "13-05-2021",
+            "datetime": "13-05-2021;10:15",
+            "numeric": "12.5",
+            "time": "10:15",
+        }.items():
+            study._CastorStudy__handle_data_point(
+                {
+                    "Field ID": f"MISSING-{field_type}-ID",
+                    "Value": raw_value,
+                    "Date": "2021-01-15 13:39:47",
+                },
+                form_instance,
+            )
+        assert form_instance.get_single_data_point("MISSING-date-ID").value is None
+        assert form_instance.get_single_data_point("MISSING-datetime-ID").value is None
+        assert form_instance.get_single_data_point("MISSING-numeric-ID").value == 12.5
+        assert form_instance.get_single_data_point("MISSING-time-ID").value == "10:15"
+
+    def test_study_get_single_field_cached(self, complete_study):
+        """Tests if a field that was searched before is returned from the cache."""
+        study = copy.deepcopy(complete_study)
+        field = study.get_single_field("Survey Field 1a3")
+        assert study.found_fields["Survey Field 1a3"] is field
+        assert study.get_single_field("Survey Field 1a3") is field
+
+    def test_study_map_structure_resets_found_fields(self, complete_study):
+        """Tests if mapping the structure empties the cache of searched fields."""
+
+        class EmptyClient:
+            """Client that returns an empty study structure."""
+
+            def __getattr__(self, name):
+                return lambda *args, **kwargs: []
+
+        study = copy.deepcopy(complete_study)
+        study.get_single_field("Survey Field 1a3")
+        assert study.found_fields
+        study.client = EmptyClient()
+        study.map_structure()
+        assert study.found_fields == {}
+        assert study.get_single_field("Survey Field 1a3") is None